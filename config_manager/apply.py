@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
-from typing import List
+from typing import Any, List, Tuple
 
-from config_manager.yaml_io import load_yaml, dump_yaml
-from config_manager.patches import get_patches, apply_patch
-
-
-CONFIGS_DIR = Path(__file__).resolve().parent.parent / "configs"
+from config_manager.yaml_io import loads_yaml, dumps_yaml
+from config_manager.patches import CONFIGS_DIR, get_patches
 
 
 def apply_patches(state, logger, i18n) -> str:
@@ -19,22 +17,35 @@ def apply_patches(state, logger, i18n) -> str:
         return "SKIP"
 
     warnings: List[str] = []
+    specs = get_patches()
 
-    for spec in get_patches():
-        target = CONFIGS_DIR / spec.filename
-        if not target.exists():
-            logger.error(i18n.t("patch.missing", path=str(target)))
+    for spec in specs:
+        if not os.path.isfile(spec.path_str):
+            logger.error(i18n.t("patch.missing", path=spec.path_str))
             sys.exit(2)
 
-        data = load_yaml(target)
-        spec_warnings = apply_patch(spec.filename, data, state, logger, i18n)
-        dump_yaml(data, target)
+    for spec in specs:
+        original, data = _load(spec.path)
+        spec_warnings = spec.handler(data, state, logger, i18n)
+        _store(spec.path, original, data)
 
         if spec_warnings:
             for message in spec_warnings:
                 logger.warn(message)
             warnings.extend(spec_warnings)
 
-        logger.info(i18n.t("patch.applied", path=str(target)))
+        logger.info(i18n.t("patch.applied", path=spec.path_str))
 
     return "PROCEED_WITH_WARNINGS" if warnings else "DONE"
+
+
+def _load(target: Path) -> Tuple[bytes, Any]:
+    original = target.read_bytes()
+    return original, loads_yaml(original)
+
+
+def _store(target: Path, original: bytes, data: Any) -> None:
+    rendered = dumps_yaml(data)
+    # idempotent re-runs leave the file untouched
+    if rendered != original:
+        target.write_bytes(rendered)
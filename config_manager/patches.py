@@ -4,19 +4,46 @@ from __future__ import annotations
 
 import secrets
 import string
-from dataclasses import dataclass
-from typing import Callable, List, Any
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Any
 
 from ruamel.yaml.comments import CommentedSeq
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
-from script.ei.network import get_primary_ip
+try:
+    # easy-install puts script/ on sys.path and imports its helpers as "ei";
+    # reuse that module instead of loading network.py a second time
+    from ei.network import get_primary_ip
+except ImportError:
+    from script.ei.network import get_primary_ip
+
+
+CONFIGS_DIR = Path(__file__).resolve().parent.parent / "configs"
+
+
+# constant values are built once and shared by every apply
+_DQ_SMTP_HOST = DoubleQuotedScalarString("smtp.example.com")
+_DQ_SMTP_USERNAME = DoubleQuotedScalarString("no-reply@example.com")
+_DQ_SMTP_PASSWORD = DoubleQuotedScalarString("change-me")
+_DQ_SMTP_ENCRYPTION = DoubleQuotedScalarString("tls")
+_DQ_SMTP_FROM = DoubleQuotedScalarString("compass@example.com")
+_DQ_ROOT_FULL_NAME = DoubleQuotedScalarString("Администратор")
+_DQ_SSL_CRT = DoubleQuotedScalarString("compass.bundle.crt")
+_DQ_SSL_KEY = DoubleQuotedScalarString("compass.key")
 
 
 @dataclass
 class PatchSpec:
     filename: str
     handler: Callable[[Any, Any, Any, Any], List[str]]  # data, state, logger, i18n
+    # resolved once at import, the config directory is fixed
+    path: Path = field(init=False)
+    path_str: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path = CONFIGS_DIR / self.filename
+        self.path_str = str(self.path)
 
 
 def _flow_seq(values: List[str]) -> CommentedSeq:
@@ -25,11 +52,24 @@ def _flow_seq(values: List[str]) -> CommentedSeq:
     return seq
 
 
+_PASSWORD_LENGTH = 12
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+# bytes at or above this limit are dropped so that byte % len(alphabet) stays unbiased
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+
+
 def _generate_password() -> str:
-    alphabet = string.ascii_letters + string.digits
+    size = len(_PASSWORD_ALPHABET)
     while True:
-        pwd = "".join(secrets.choice(alphabet) for _ in range(12))
-        if any(c.islower() for c in pwd) and any(c.isupper() for c in pwd) and any(c.isdigit() for c in pwd):
+        raw = secrets.token_bytes(_PASSWORD_LENGTH * 2)
+        chars = [_PASSWORD_ALPHABET[b % size] for b in raw if b < _PASSWORD_BYTE_LIMIT]
+        if len(chars) < _PASSWORD_LENGTH:
+            continue
+        pwd = "".join(chars[:_PASSWORD_LENGTH])
+        if not _LOWER.isdisjoint(pwd) and not _UPPER.isdisjoint(pwd) and not _DIGITS.isdisjoint(pwd):
             return pwd
 
 
@@ -38,12 +78,12 @@ def _patch_auth(data, state, logger, i18n) -> List[str]:
     data["available_guest_methods"] = _flow_seq(["mail"])
     data["mail.registration_2fa_enabled"] = False
     data["mail.authorization_2fa_enabled"] = False
-    data["smtp.host"] = DoubleQuotedScalarString("smtp.example.com")
+    data["smtp.host"] = _DQ_SMTP_HOST
     data["smtp.port"] = 587
-    data["smtp.username"] = DoubleQuotedScalarString("no-reply@example.com")
-    data["smtp.password"] = DoubleQuotedScalarString("change-me")
-    data["smtp.encryption"] = DoubleQuotedScalarString("tls")
-    data["smtp.from"] = DoubleQuotedScalarString("compass@example.com")
+    data["smtp.username"] = _DQ_SMTP_USERNAME
+    data["smtp.password"] = _DQ_SMTP_PASSWORD
+    data["smtp.encryption"] = _DQ_SMTP_ENCRYPTION
+    data["smtp.from"] = _DQ_SMTP_FROM
     logger.info(i18n.t("patch.auth"))
     return []
 
@@ -56,7 +96,7 @@ def _patch_captcha(data, state, logger, i18n) -> List[str]:
 
 def _patch_team(data, state, logger, i18n) -> List[str]:
     warnings: List[str] = []
-    data["root_user.full_name"] = DoubleQuotedScalarString("Администратор")
+    data["root_user.full_name"] = _DQ_ROOT_FULL_NAME
 
     admin_mail = state.admin_email or "admin@example.com"
     data["root_user.mail"] = DoubleQuotedScalarString(admin_mail)
@@ -79,8 +119,8 @@ def _patch_team(data, state, logger, i18n) -> List[str]:
 
 def _patch_global(data, state, logger, i18n) -> List[str]:
     warnings: List[str] = []
-    data["nginx.ssl_crt"] = DoubleQuotedScalarString("compass.bundle.crt")
-    data["nginx.ssl_key"] = DoubleQuotedScalarString("compass.key")
+    data["nginx.ssl_crt"] = _DQ_SSL_CRT
+    data["nginx.ssl_key"] = _DQ_SSL_KEY
 
     domain = state.domain or ""
     data["domain"] = DoubleQuotedScalarString(domain)
@@ -106,11 +146,14 @@ PATCHES: List[PatchSpec] = [
 ]
 
 
+_PATCHES_BY_NAME: Dict[str, PatchSpec] = {spec.filename: spec for spec in PATCHES}
+
+
 def apply_patch(filename: str, data, state, logger, i18n) -> List[str]:
-    for spec in PATCHES:
-        if spec.filename == filename:
-            return spec.handler(data, state, logger, i18n)
-    return []
+    spec = _PATCHES_BY_NAME.get(filename)
+    if spec is None:
+        return []
+    return spec.handler(data, state, logger, i18n)
 
 
 def get_patches() -> List[PatchSpec]:
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import Any
 
 from ruamel.yaml import YAML
 
 
-_yaml = YAML()
+# Round-trip mode is required: the generated configs are user-facing and
+# heavily commented, so the libyaml-backed safe loader/dumper cannot be used.
+_yaml = YAML(typ="rt")
 _yaml.default_flow_style = False
 _yaml.indent(mapping=2, sequence=4, offset=2)
 
 
 def load_yaml(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as fh:
-        return _yaml.load(fh)
+    return loads_yaml(path.read_bytes())
 
 
 def dump_yaml(data: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        _yaml.dump(data, fh)
+    path.write_bytes(dumps_yaml(data))
+
+
+def loads_yaml(raw: bytes) -> Any:
+    return _yaml.load(raw)
+
+
+def dumps_yaml(data: Any) -> bytes:
+    buf = io.BytesIO()
+    _yaml.dump(data, buf)
+    return buf.getvalue()
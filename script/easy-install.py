@@ -4,24 +4,15 @@ from __future__ import annotations
 import argparse, sys, os
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-# local imports
+# local imports; step modules are imported where the step runs so that
+# --help, dry-run and early validation failures do not pay for them
 from ei.python_gate import ensure_python
-from ei.capacity import check_capacity
-from ei.bench import run_benchmarks
-from ei.os_detect import detect_os
-from ei.apparmor import handle_apparmor
-from ei.pkg_manager import ensure_packages
-from ei.docker_service import ensure_docker_service
-from ei.venv_manager import ensure_virtualenv
-from ei.run_create_configs import run_create_configs
-from ei.certs import ensure_certificates
-from ei.install_runner import run_install
-from ei.summary import print_summary
 from ei.i18n import I18N
 from ei.logger import Logger
 from ei.state import State
@@ -34,24 +25,44 @@ def apply_config_patches(state, logger, i18n):
 
     return _apply_patches(state, logger, i18n)
 
+CLI_OPTIONS = (
+    "yes", "lang", "domain", "le", "root_mount", "admin_email", "admin_password",
+    "skip_checks", "skip_bench", "bench_runtime", "log_file", "dry_run", "verbose", "skip_install",
+)
+
+STEPS = (
+    "python_check", "capacity_check", "apparmor", "iops_bench", "os_detect", "pkg_install", "docker",
+    "venv", "configs", "cert", "yaml_patch", "install", "summary",
+)
+
 def build_parser(i18n: I18N) -> argparse.ArgumentParser:
+    opts = i18n.tmany(CLI_OPTIONS, prefix="cli.opt.")
     p = argparse.ArgumentParser(description=i18n.t("cli.help"))
-    p.add_argument("-y", "--yes", action="store_true", help=i18n.t("cli.opt.yes"))
-    p.add_argument("-l", "--lang", choices=["ru","en"], default="ru", help=i18n.t("cli.opt.lang"))
-    p.add_argument("-d", "--domain", default=None, help=i18n.t("cli.opt.domain"))
-    p.add_argument("--le", action="store_true", help=i18n.t("cli.opt.le"))
-    p.add_argument("--root-mount", default="/opt/compass_data", help=i18n.t("cli.opt.root_mount"))
-    p.add_argument("--admin-email", default=None, help=i18n.t("cli.opt.admin_email"))
-    p.add_argument("--admin-password", default=None, help=i18n.t("cli.opt.admin_password"))
-    p.add_argument("--skip-checks", action="store_true", help=i18n.t("cli.opt.skip_checks"))
-    p.add_argument("--skip-bench", action="store_true", help=i18n.t("cli.opt.skip_bench"))
-    p.add_argument("--bench-runtime", type=int, default=20, help=i18n.t("cli.opt.bench_runtime"))
-    p.add_argument("--log-file", default=None, help=i18n.t("cli.opt.log_file"))
-    p.add_argument("--dry-run", action="store_true", help=i18n.t("cli.opt.dry_run"))
-    p.add_argument("--verbose", action="store_true", help=i18n.t("cli.opt.verbose"))
-    p.add_argument("--skip-install", action="store_true", help=i18n.t("cli.opt.skip_install"))
+    p.add_argument("-y", "--yes", action="store_true", help=opts["yes"])
+    p.add_argument("-l", "--lang", choices=["ru","en"], default="ru", help=opts["lang"])
+    p.add_argument("-d", "--domain", default=None, help=opts["domain"])
+    p.add_argument("--le", action="store_true", help=opts["le"])
+    p.add_argument("--root-mount", default="/opt/compass_data", help=opts["root_mount"])
+    p.add_argument("--admin-email", default=None, help=opts["admin_email"])
+    p.add_argument("--admin-password", default=None, help=opts["admin_password"])
+    p.add_argument("--skip-checks", action="store_true", help=opts["skip_checks"])
+    p.add_argument("--skip-bench", action="store_true", help=opts["skip_bench"])
+    p.add_argument("--bench-runtime", type=int, default=20, help=opts["bench_runtime"])
+    p.add_argument("--log-file", default=None, help=opts["log_file"])
+    p.add_argument("--dry-run", action="store_true", help=opts["dry_run"])
+    p.add_argument("--verbose", action="store_true", help=opts["verbose"])
+    p.add_argument("--skip-install", action="store_true", help=opts["skip_install"])
     return p
 
+def peek_lang(argv: List[str]) -> Optional[str]:
+    # malformed values are left for argparse to report
+    for i, arg in enumerate(argv):
+        if arg in ("-l", "--lang"):
+            return argv[i + 1] if i + 1 < len(argv) else None
+        if arg.startswith("--lang="):
+            return arg.split("=", 1)[1]
+    return None
+
 def default_log_path() -> Path:
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     return REPO_ROOT / "logs" / f"easy-install_{ts}.log"
@@ -65,22 +76,16 @@ def main() -> int:
     parser = build_parser(i18n)
 
     # peek lang early to rebuild parser with correct language if needed
-    argv = sys.argv[1:]
-    try:
-        lang_idx = next(i for i,a in enumerate(argv) if a in ("-l","--lang"))
-        lang_val = argv[lang_idx+1]
+    lang_val = peek_lang(sys.argv[1:])
+    if lang_val and lang_val != i18n.lang:
         i18n = I18N(REPO_ROOT / "locales", lang_val)
         parser = build_parser(i18n)
-    except StopIteration:
-        pass
-    except Exception:
-        # ignore malformed, argparse will handle
-        pass
 
     args = parser.parse_args()
 
     # finalize i18n and logger
-    i18n = I18N(REPO_ROOT / "locales", args.lang)
+    if args.lang != i18n.lang:
+        i18n = I18N(REPO_ROOT / "locales", args.lang)
     log_path = Path(args.log_file) if args.log_file else default_log_path()
     logger = Logger(log_path, verbose=args.verbose)
 
@@ -123,21 +128,8 @@ def main() -> int:
     )
 
     # Dry-run plan (list stages; implementation will be added in next steps)
-    plan = [
-        i18n.t("step.python_check"),
-        i18n.t("step.capacity_check"),
-        i18n.t("step.apparmor"),
-        i18n.t("step.iops_bench"),
-        i18n.t("step.os_detect"),
-        i18n.t("step.pkg_install"),
-        i18n.t("step.docker"),
-        i18n.t("step.venv"),
-        i18n.t("step.configs"),
-        i18n.t("step.cert"),
-        i18n.t("step.yaml_patch"),
-        i18n.t("step.install"),
-        i18n.t("step.summary")
-    ]
+    steps = i18n.tmany(STEPS, prefix="step.")
+    plan = list(steps.values())
     logger.info(i18n.t("log.summary",
         yes=state.yes,
         domain=state.domain,
@@ -157,38 +149,42 @@ def main() -> int:
     # steps execution (partially implemented)
     os_info = None
     step_idx = 1
-    logger.step(step_idx, total, i18n.t("step.python_check"))
+    logger.step(step_idx, total, steps["python_check"])
     logger.status("DONE")
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.capacity_check"))
+    logger.step(step_idx, total, steps["capacity_check"])
     if state.dry_run:
         logger.info(i18n.t("capacity.dry_run"))
         logger.status("SKIP")
     else:
+        from ei.capacity import check_capacity
         status = check_capacity(state, logger, i18n)
         logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.apparmor"))
+    logger.step(step_idx, total, steps["apparmor"])
+    from ei.apparmor import handle_apparmor
     status = handle_apparmor(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.iops_bench"))
+    logger.step(step_idx, total, steps["iops_bench"])
     if state.dry_run:
         logger.info(i18n.t("bench.dry_run"))
         logger.status("SKIP")
     else:
+        from ei.bench import run_benchmarks
         status = run_benchmarks(state, logger, i18n)
         logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.os_detect"))
+    logger.step(step_idx, total, steps["os_detect"])
     if state.dry_run:
         logger.info(i18n.t("os.dry_run"))
         logger.status("SKIP")
     else:
+        from ei.os_detect import detect_os
         os_info = detect_os(logger, i18n)
         state.os_type = os_info.os_type.value
         state.os_id = os_info.os_id
@@ -197,12 +193,14 @@ def main() -> int:
         logger.status("DONE")
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.pkg_install"))
+    logger.step(step_idx, total, steps["pkg_install"])
     if state.dry_run:
         logger.info(i18n.t("pkg.dry_run"))
         logger.status("SKIP")
     else:
+        from ei.pkg_manager import ensure_packages
         if os_info is None:
+            from ei.os_detect import detect_os
             os_info = detect_os(logger, i18n)
             state.os_type = os_info.os_type.value
             state.os_id = os_info.os_id
@@ -212,27 +210,31 @@ def main() -> int:
         logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.docker"))
+    logger.step(step_idx, total, steps["docker"])
+    from ei.docker_service import ensure_docker_service
     status = ensure_docker_service(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.venv"))
+    logger.step(step_idx, total, steps["venv"])
+    from ei.venv_manager import ensure_virtualenv
     status = ensure_virtualenv(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.configs"))
+    logger.step(step_idx, total, steps["configs"])
+    from ei.run_create_configs import run_create_configs
     status = run_create_configs(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.cert"))
+    logger.step(step_idx, total, steps["cert"])
+    from ei.certs import ensure_certificates
     status = ensure_certificates(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.yaml_patch"))
+    logger.step(step_idx, total, steps["yaml_patch"])
     if state.dry_run:
         logger.info(i18n.t("patch.dry_run", path=str(REPO_ROOT / "configs")))
         logger.status("SKIP")
@@ -241,12 +243,14 @@ def main() -> int:
         logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.install"))
+    logger.step(step_idx, total, steps["install"])
+    from ei.install_runner import run_install
     status = run_install(state, logger, i18n)
     logger.status(status)
 
     step_idx += 1
-    logger.step(step_idx, total, i18n.t("step.summary"))
+    logger.step(step_idx, total, steps["summary"])
+    from ei.summary import print_summary
     status = print_summary(state, logger, i18n)
     logger.status(status)
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import shutil
+import os
+import shlex
 import subprocess
 import sys
-from pathlib import Path
+from functools import lru_cache
 from typing import List
 
+from .which import which
+from .prompt import ask_yes
 
-_APPARMOR_INIT = Path("/etc/init.d/apparmor")
+
+_APPARMOR_INIT = "/etc/init.d/apparmor"
 
 
 def handle_apparmor(state, logger, i18n) -> str:
@@ -23,46 +27,47 @@ def handle_apparmor(state, logger, i18n) -> str:
 
     if not state.yes:
         try:
-            answer = input(i18n.t("apparmor.prompt") + " ").strip().lower()
+            answer = ask_yes(i18n.t("apparmor.prompt") + " ")
         except KeyboardInterrupt:
             logger.info(i18n.t("apparmor.abort"))
             sys.exit(130)
-        if answer not in {"y", "yes", "д", "да"}:
+        if not answer:
             logger.info(i18n.t("apparmor.decline"))
             return "WARN"
 
     commands: List[List[str]] = [
-        ["/etc/init.d/apparmor", "stop"],
+        [_APPARMOR_INIT, "stop"],
         ["update-rc.d", "-f", "apparmor", "remove"],
         ["apt-get", "remove", "-y", "apparmor"],
     ]
 
-    for cmd in commands:
-        logger.info(i18n.t("apparmor.cmd", command=" ".join(cmd)))
-        try:
-            subprocess.run(cmd, check=True)
-        except subprocess.CalledProcessError as exc:
-            logger.error(i18n.t("apparmor.fail", command=" ".join(cmd), code=exc.returncode))
-            sys.exit(exc.returncode or 2)
+    # one shell for the whole sequence; && stops at the first failing step
+    script = " && ".join(shlex.join(cmd) for cmd in commands)
+    logger.info(i18n.t("apparmor.cmd", command=script))
+    try:
+        subprocess.run(["bash", "-c", script], check=True)
+    except subprocess.CalledProcessError as exc:
+        logger.error(i18n.t("apparmor.fail", command=script, code=exc.returncode))
+        sys.exit(exc.returncode or 2)
 
     logger.info(i18n.t("apparmor.removed"))
     return "DONE"
 
 
+@lru_cache(maxsize=1)
 def _is_present() -> bool:
-    if _APPARMOR_INIT.exists():
+    if os.path.exists(_APPARMOR_INIT):
         return True
-    if shutil.which("apparmor_status"):
+    if which("apparmor_status"):
         return True
     # systemd unit check
     try:
         result = subprocess.run(
             ["systemctl", "list-unit-files", "apparmor.service"],
             capture_output=True,
-            text=True,
             check=False,
         )
-        return "apparmor.service" in (result.stdout or "")
+        return b"apparmor.service" in (result.stdout or b"")
     except Exception:
         return False
 
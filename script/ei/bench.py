@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .docker_root import ensure_docker_root
+from .prompt import ask_yes
+from .which import which
 
 GiB = 1024 ** 3
 
@@ -19,6 +21,11 @@ DEFAULT_DOCKER_ROOT = Path("/var/lib/docker")
 TEST_FILENAME = "easy-install-fio-test.bin"
 READ_LIMITS = {"avg": 600.0, "min": 288.0}
 WRITE_LIMITS = {"avg": 600.0, "min": 324.0}
+# thresholds as shown in bench.metrics / bench.warn messages
+_REQUIRED_LABELS = {
+    mode: {"req_avg": f"{limits['avg']:.0f}", "req_min": f"{limits['min']:.0f}"}
+    for mode, limits in (("randread", READ_LIMITS), ("randwrite", WRITE_LIMITS))
+}
 
 
 @dataclass
@@ -40,14 +47,14 @@ def run_benchmarks(state, logger, i18n) -> str:
         logger.info(i18n.t("bench.dry_run"))
         return "SKIP"
 
-    fio_path = shutil.which("fio")
+    fio_path = which("fio")
     if not fio_path:
         logger.warn(i18n.t("bench.no_fio"))
         logger.info(i18n.t("bench.install_hint"))
         if state.yes:
             logger.info(i18n.t("bench.auto_skip"))
             return "SKIP fio"
-        if not _prompt_continue(i18n):
+        if not ask_yes(i18n.t("bench.confirm") + " "):
             logger.info(i18n.t("bench.aborted"))
             sys.exit(2)
         logger.info(i18n.t("bench.manual_skip"))
@@ -59,8 +66,8 @@ def run_benchmarks(state, logger, i18n) -> str:
     locations = _collect_locations(state, docker_root)
     warnings: List[str] = []
 
+    ready: List[Path] = []
     for location in locations:
-        location = location.resolve()
         try:
             location.mkdir(parents=True, exist_ok=True)
         except Exception as exc:  # pragma: no cover - defensive
@@ -68,40 +75,23 @@ def run_benchmarks(state, logger, i18n) -> str:
             logger.warn(msg)
             warnings.append(msg)
             continue
-
-        test_file = location / TEST_FILENAME
-
-        write_success = False
-        for mode in ("randwrite", "randread"):
-            if mode == "randread" and not write_success:
-                # skip read if write failed
-                continue
-
-            metrics, err_msg = _run_single(fio_path, test_file, mode, state.bench_runtime, i18n)
-            if err_msg:
-                logger.warn(err_msg)
-                warnings.append(err_msg)
-                if mode == "randwrite":
-                    write_success = False
-                continue
-
-            assert metrics is not None
-            if mode == "randwrite":
-                write_success = True
-
-            limits = READ_LIMITS if mode == "randread" else WRITE_LIMITS
-            logger.info(i18n.t("bench.metrics", path=str(location), mode=mode, avg=f"{metrics.avg:.2f}", min=f"{metrics.minimum:.2f}", req_avg=f"{limits['avg']:.0f}", req_min=f"{limits['min']:.0f}"))
-
-            if metrics.avg < limits["avg"] or metrics.minimum < limits["min"]:
-                warn = i18n.t("bench.warn", path=str(location), mode=mode, avg=f"{metrics.avg:.2f}", min=f"{metrics.minimum:.2f}", req_avg=f"{limits['avg']:.0f}", req_min=f"{limits['min']:.0f}")
-                logger.warn(warn)
-                warnings.append(warn)
-
-        try:
-            if test_file.exists():
-                test_file.unlink()
-        except Exception:
-            pass
+        ready.append(location)
+
+    # locations are on distinct block devices, so their fio runs do not
+    # compete for the same disk and can execute side by side
+    with ThreadPoolExecutor(max_workers=max(len(ready), 1)) as pool:
+        futures = [
+            pool.submit(_bench_location, fio_path, location, state.bench_runtime, i18n)
+            for location in ready
+        ]
+        # report in submission order so the log stays deterministic
+        for future in futures:
+            for level, message in future.result():
+                if level == "warn":
+                    logger.warn(message)
+                    warnings.append(message)
+                else:
+                    logger.info(message)
 
     if not warnings:
         logger.info(i18n.t("bench.ok"))
@@ -113,7 +103,7 @@ def run_benchmarks(state, logger, i18n) -> str:
         logger.info(i18n.t("bench.auto_proceed"))
         return "PROCEED_WITH_WARNINGS"
 
-    if _prompt_continue(i18n):
+    if ask_yes(i18n.t("bench.confirm") + " "):
         return "PROCEED_WITH_WARNINGS"
 
     logger.info(i18n.t("bench.aborted"))
@@ -122,12 +112,63 @@ def run_benchmarks(state, logger, i18n) -> str:
 
 def _collect_locations(state, docker_root: Path) -> List[Path]:
     roots = [Path(state.root_mount), docker_root]
-    unique: Dict[str, Path] = {}
-    for path in roots:
-        unique[str(path.resolve())] = path
+    # keyed by device: a second path on the same disk (symlink, bind mount,
+    # plain subdirectory) would only repeat the benchmark on the same hardware
+    unique: Dict[object, Path] = {}
+    for root in roots:
+        real = os.path.realpath(root)
+        path = Path(real)
+        try:
+            os.makedirs(real, exist_ok=True)
+            key: object = os.stat(real).st_dev
+        except OSError:
+            # run_benchmarks reports the failure when it creates the directory
+            key = str(path)
+        unique.setdefault(key, path)
     return list(unique.values())
 
 
+def _bench_location(fio_path: str, location: Path, runtime: int, i18n) -> List[Tuple[str, str]]:
+    """Benchmark a single location; returns (level, message) log entries."""
+
+    entries: List[Tuple[str, str]] = []
+    # randwrite lays the 1G file out once and randread reuses it, so the file
+    # is removed only after both modes have run
+    test_file = location / TEST_FILENAME
+    path_label = str(location)
+
+    write_success = False
+    for mode in ("randwrite", "randread"):
+        if mode == "randread" and not write_success:
+            # skip read if write failed
+            continue
+
+        metrics, err_msg = _run_single(fio_path, test_file, mode, runtime, i18n)
+        if err_msg:
+            entries.append(("warn", err_msg))
+            if mode == "randwrite":
+                write_success = False
+            continue
+
+        assert metrics is not None
+        if mode == "randwrite":
+            write_success = True
+
+        limits = READ_LIMITS if mode == "randread" else WRITE_LIMITS
+        fields = dict(path=path_label, mode=mode, avg=f"{metrics.avg:.2f}", min=f"{metrics.minimum:.2f}", **_REQUIRED_LABELS[mode])
+        entries.append(("info", i18n.t("bench.metrics", **fields)))
+
+        if metrics.avg < limits["avg"] or metrics.minimum < limits["min"]:
+            entries.append(("warn", i18n.t("bench.warn", **fields)))
+
+    try:
+        os.unlink(test_file)
+    except OSError:
+        pass
+
+    return entries
+
+
 def _run_single(fio_path: str, filename: Path, mode: str, runtime: int, i18n) -> tuple[Optional[BenchmarkMetrics], Optional[str]]:
     cmd = [
         fio_path,
@@ -147,18 +188,19 @@ def _run_single(fio_path: str, filename: Path, mode: str, runtime: int, i18n) ->
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else exc.stdout
-        return None, i18n.t("bench.exec_error", mode=mode, error=stderr)
+        output = exc.stderr or exc.stdout or b""
+        return None, i18n.t("bench.exec_error", mode=mode, error=output.decode("utf-8", "replace").strip())
     except FileNotFoundError:
         return None, i18n.t("bench.no_fio")
     except Exception as exc:  # pragma: no cover - defensive
         return None, i18n.t("bench.exec_error", mode=mode, error=str(exc))
 
     try:
+        # json accepts bytes directly; ValueError also covers undecodable output
         data = json.loads(result.stdout)
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         return None, i18n.t("bench.parse_error", mode=mode, error=str(exc))
 
     jobs = data.get("jobs") or []
@@ -172,8 +214,3 @@ def _run_single(fio_path: str, filename: Path, mode: str, runtime: int, i18n) ->
     minimum = float(stats.get("iops_min", 0.0) or 0.0)
 
     return BenchmarkMetrics(filename.parent, mode, avg, minimum), None
-
-
-def _prompt_continue(i18n) -> bool:
-    answer = input(i18n.t("bench.confirm") + " ").strip().lower()
-    return answer in {"y", "yes", "д", "да"}
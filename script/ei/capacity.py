@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import os
-import shutil
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from .docker_root import ensure_docker_root
+from .prompt import ask_yes
 
 CPU_MIN = 8
 RAM_MIN_GIB = 16
@@ -39,7 +40,7 @@ def check_capacity(state, logger, i18n) -> str:
 
     warnings: List[str] = []
 
-    cpu_count = os.cpu_count() or 0
+    cpu_count = _cpu_count()
     logger.info(i18n.t("capacity.cpu", actual=cpu_count, required=CPU_MIN))
     if cpu_count == 0:
         warnings.append(i18n.t("capacity.cpu_unknown"))
@@ -86,7 +87,7 @@ def check_capacity(state, logger, i18n) -> str:
         return "PROCEED_WITH_WARNINGS"
 
     try:
-        answer = _prompt(i18n)
+        answer = ask_yes(i18n.t("capacity.confirm") + " ")
     except KeyboardInterrupt:
         logger.info(i18n.t("capacity.user_abort"))
         sys.exit(130)
@@ -104,48 +105,75 @@ def _gather_disk_checks(state, docker_root: Path) -> List[DiskCheckResult]:
         (docker_root, DISK_MIN_GIB),
     ]
 
+    # root mount and docker root usually live on the same filesystem,
+    # query free space once per device
+    free_by_device: Dict[Union[int, str], Optional[float]] = {}
     results: List[DiskCheckResult] = []
     for path, required in targets:
-        checked = _existing_parent(path)
-        free_gib = _disk_free_gib(checked)
+        checked = _existing_parent(str(path))
+        key = _device_key(checked)
+        if key not in free_by_device:
+            free_by_device[key] = _disk_free_gib(str(checked))
+        free_gib = free_by_device[key]
         ok = free_gib is not None and free_gib >= required
         results.append(DiskCheckResult(path, checked, free_gib, required, ok))
     return results
 
 
-def _existing_parent(path: Path) -> Path:
-    current = path
-    while not current.exists():
-        if current.parent == current:
-            return current
-        current = current.parent
-    return current
+@lru_cache(maxsize=1)
+def _cpu_count() -> int:
+    return os.cpu_count() or 0
+
 
+def _device_key(path: Path) -> Union[int, str]:
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return str(path)
 
-def _disk_free_gib(path: Path) -> Optional[float]:
+
+@lru_cache(maxsize=None)
+def _existing_parent(path: str) -> Path:
+    # walk plain strings; a path that exists costs a single stat
+    current = path
+    while True:
+        try:
+            os.stat(current)
+            return Path(current)
+        except (FileNotFoundError, NotADirectoryError):
+            parent = os.path.dirname(current)
+            if parent == current:
+                return Path(current)
+            current = parent
+
+
+@lru_cache(maxsize=None)
+def _disk_free_gib(path: str) -> Optional[float]:
     try:
-        usage = shutil.disk_usage(path)
-    except FileNotFoundError:
+        st = os.statvfs(path)
+    except OSError:
         return None
-    return usage.free / GiB
+    return st.f_bavail * st.f_frsize / GiB
 
 
 def _read_mem_total_gib() -> Optional[float]:
-    meminfo = Path("/proc/meminfo")
+    # /proc/meminfo is small: read it with a single syscall and parse the bytes
     try:
-        with meminfo.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                if line.startswith("MemTotal:"):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        kb = float(parts[1])
-                        return kb * 1024 / GiB
-    except (OSError, ValueError):
+        fd = os.open("/proc/meminfo", os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
         return None
-    return None
 
-
-def _prompt(i18n) -> bool:
-    prompt = i18n.t("capacity.confirm") + " "
-    answer = input(prompt).strip().lower()
-    return answer in {"y", "yes", "д", "да"}
+    idx = data.find(b"MemTotal:")
+    if idx < 0:
+        return None
+    end = data.find(b"\n", idx)
+    fields = data[idx + 9:end if end >= 0 else None].split()
+    try:
+        kb = int(fields[0])
+    except (IndexError, ValueError):
+        return None
+    return kb * 1024 / GiB
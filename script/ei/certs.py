@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import ipaddress
 import os
 import re
+import shutil
+import string
 import subprocess
 import sys
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from .network import get_primary_ip
+from .prompt import ask_yes
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -20,6 +21,33 @@ BUNDLE_NAME = "compass.bundle.crt"
 KEY_NAME = "compass.key"
 INTERMEDIATE_CERT = REPO_ROOT / "packages" / "ca" / "intermediate.crt"
 INTERMEDIATE_KEY = REPO_ROOT / "packages" / "ca" / "intermediate.key"
+ACME_URL = "https://raw.githubusercontent.com/acmesh-official/acme.sh/3.0.7/acme.sh"
+
+# nginx configs for stateless ACME challenges; "$$" is a literal "$"
+_ACME_SNIPPET_TEMPLATE = string.Template(r"""location ~ ^/\.well-known/acme-challenge/([-_a-zA-Z0-9]+)$$ {
+    default_type text/plain;
+    return 200 "\"$$1.$thumbprint\"";
+}
+""")
+_ACME_SERVER_TEMPLATE = string.Template(r"""server {
+    listen 80;
+    return 404;
+}
+
+server {
+    listen 80;
+    server_name $domain;
+
+    location ~ ^/\.well-known/acme-challenge/([-_a-zA-Z0-9]+)$$ {
+        default_type text/plain;
+        return 200 "$$1.$thumbprint";
+    }
+
+    location / {
+        return 301 https://$$host$$request_uri;
+    }
+}
+""")
 
 
 class CertError(Exception):
@@ -39,7 +67,6 @@ def ensure_certificates(state, logger, i18n) -> str:
         try:
             logger.info(i18n.t("certs.mode_le", domain=state.domain))
             _issue_letsencrypt(state.domain, bundle_path, key_path, logger, i18n)
-            _secure_files(bundle_path, key_path)
             logger.info(i18n.t("certs.done", bundle=str(bundle_path), cert_key=str(key_path)))
             return "DONE"
         except CertError as exc:
@@ -47,33 +74,37 @@ def ensure_certificates(state, logger, i18n) -> str:
             if state.yes:
                 logger.info(i18n.t("certs.auto_fallback"))
             else:
-                if not _prompt_continue(i18n):
+                if not ask_yes(i18n.t("certs.prompt_fallback") + " "):
                     logger.info(i18n.t("certs.abort"))
                     sys.exit(2)
                 logger.info(i18n.t("certs.manual_fallback"))
 
     logger.info(i18n.t("certs.mode_local"))
-    _issue_local(state.domain, bundle_path, key_path, logger, i18n)
-    _secure_files(bundle_path, key_path)
+    if not state.host_ip:
+        state.host_ip = get_primary_ip()
+    _issue_local(state.domain, state.host_ip, bundle_path, key_path, logger, i18n)
     logger.info(i18n.t("certs.done", bundle=str(bundle_path), cert_key=str(key_path)))
     return "DONE"
 
 
-def _issue_local(domain: str | None, bundle_path: Path, key_path: Path, logger, i18n) -> None:
-    if not INTERMEDIATE_CERT.exists() or not INTERMEDIATE_KEY.exists():
+def _issue_local(domain: str | None, ip_value: str | None, bundle_path: Path, key_path: Path, logger, i18n) -> None:
+    if not os.path.exists(INTERMEDIATE_CERT) or not os.path.exists(INTERMEDIATE_KEY):
         raise CertError(i18n.t("certs.intermediate_missing"))
 
-    ip_value = get_primary_ip()
     if ip_value is None:
         raise CertError(i18n.t("certs.ip_missing"))
 
     logger.info(i18n.t("certs.local_prepare", ip=ip_value, domain=domain or ""))
 
+    # only the local CA path needs these
+    import ipaddress
+    from datetime import datetime, timedelta, timezone
+
     try:
         from cryptography import x509
         from cryptography.hazmat.backends import default_backend
         from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.primitives.asymmetric import ec
         from cryptography.hazmat.primitives.serialization import load_pem_private_key
         from cryptography.x509.oid import NameOID
     except ImportError as exc:
@@ -84,14 +115,15 @@ def _issue_local(domain: str | None, bundle_path: Path, key_path: Path, logger,
     with INTERMEDIATE_KEY.open("rb") as fh:
         ca_key = load_pem_private_key(fh.read(), password=None, backend=default_backend())
 
-    key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+    # P-256 keygen is a single scalar multiplication, RSA-2048 needs a prime search
+    key = ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
 
     subject_name = domain or ip_value
     name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject_name)])
     basic_constraints = x509.BasicConstraints(ca=False, path_length=None)
     key_usage = x509.KeyUsage(
         digital_signature=True,
-        key_encipherment=True,
+        key_encipherment=False,  # not applicable to EC keys
         content_commitment=False,
         data_encipherment=False,
         key_agreement=False,
@@ -130,8 +162,8 @@ def _issue_local(domain: str | None, bundle_path: Path, key_path: Path, logger,
     with INTERMEDIATE_CERT.open("rb") as fh:
         intermediate_pem = fh.read()
 
-    bundle_path.write_bytes(cert_pem + intermediate_pem)
-    key_path.write_bytes(key_pem)
+    _write_file(bundle_path, cert_pem + intermediate_pem, 0o600)
+    _write_file(key_path, key_pem, 0o600)
 
 
 def _issue_letsencrypt(domain: str, bundle_path: Path, key_path: Path, logger, i18n) -> None:
@@ -139,13 +171,9 @@ def _issue_letsencrypt(domain: str, bundle_path: Path, key_path: Path, logger, i
     le_dir.mkdir(parents=True, exist_ok=True)
 
     acme_path = le_dir / "acme.sh"
-    if not acme_path.exists():
+    if not os.path.exists(acme_path):
         logger.info(i18n.t("certs.le_download"))
-        subprocess.run([
-            "wget", "-O", str(acme_path),
-            "https://raw.githubusercontent.com/acmesh-official/acme.sh/3.0.7/acme.sh"
-        ], check=True)
-        subprocess.run(["chmod", "+x", str(acme_path)], check=True)
+        _download_acme(acme_path, i18n)
 
     _run_acme([str(acme_path), "--home", str(le_dir), "--set-default-ca", "--server", "letsencrypt"], i18n)
     _run_acme([str(acme_path), "--upgrade", "--home", str(le_dir)], i18n)
@@ -163,38 +191,14 @@ def _issue_letsencrypt(domain: str, bundle_path: Path, key_path: Path, logger, i
     snippets_dir.mkdir(parents=True, exist_ok=True)
     acme_snippet = snippets_dir / "acme_stateless.conf"
     if thumbprint:
-        acme_snippet.write_text(
-            """location ~ ^/\\.well-known/acme-challenge/([-_a-zA-Z0-9]+)$ {{
-    default_type text/plain;
-    return 200 "\\"$1.{thumbprint}\\"";
-}}
-""".format(thumbprint=thumbprint)
-        )
+        snippet = _ACME_SNIPPET_TEMPLATE.substitute(thumbprint=thumbprint)
+        _write_file(acme_snippet, snippet.encode("utf-8"), 0o644)
 
     acme_conf_path = Path("/etc/nginx/conf.d")
     acme_conf_path.mkdir(parents=True, exist_ok=True)
     acme_conf_file = acme_conf_path / "acme.easy-install.conf"
-    acme_conf_file.write_text(
-        f"""server {{
-    listen 80;
-    return 404;
-}}
-
-server {{
-    listen 80;
-    server_name {domain};
-
-    location ~ ^/\\.well-known/acme-challenge/([-_a-zA-Z0-9]+)$ {{
-        default_type text/plain;
-        return 200 \"$1.{thumbprint or ''}\";
-    }}
-
-    location / {{
-        return 301 https://$host$request_uri;
-    }}
-}}
-"""
-    )
+    server_conf = _ACME_SERVER_TEMPLATE.substitute(domain=domain, thumbprint=thumbprint or "")
+    _write_file(acme_conf_file, server_conf.encode("utf-8"), 0o644)
 
     _run_acme(["/usr/sbin/nginx", "-t"], i18n)
     _run_acme(["/usr/sbin/nginx", "-s", "reload"], i18n)
@@ -203,36 +207,70 @@ server {{
     final_crt = cert_subdir / "fullchain.cer"
     final_key = cert_subdir / f"{domain}.key"
 
-    if not final_crt.exists() or not final_key.exists():
+    if not os.path.exists(final_crt) or not os.path.exists(final_key):
         logger.info(i18n.t("certs.le_issue", domain=domain))
         _run_acme([
             str(acme_path), "--home", str(le_dir), "--issue", "--force", "--stateless", "-d", domain
         ], i18n)
 
-    bundle_path.write_bytes(final_crt.read_bytes())
-    key_path.write_bytes(final_key.read_bytes())
+    _write_file(bundle_path, final_crt.read_bytes(), 0o600)
+    _write_file(key_path, final_key.read_bytes(), 0o600)
 
     renew_cmd = f"{acme_path} --home {le_dir} --renew --force --stateless -d {domain}"
     nginx_reload_cmd = "/usr/sbin/nginx -t && /usr/sbin/nginx -s reload"
 
-    _run_acme([
-        "bash", "-c",
-        f'(crontab -l 2>/dev/null | grep -v -F "{renew_cmd}"); echo "0 0 15 * * {renew_cmd}" | crontab -'
-    ], i18n)
-    _run_acme([
-        "bash", "-c",
-        f'(crontab -l 2>/dev/null | grep -v -F "{nginx_reload_cmd}"); echo "0 3 15 * * {nginx_reload_cmd}" | crontab -'
+    _install_cron([
+        ("0 0 15 * *", renew_cmd),
+        ("0 3 15 * *", nginx_reload_cmd),
     ], i18n)
 
 
-def _secure_files(bundle_path: Path, key_path: Path) -> None:
-    os.chmod(bundle_path, 0o600)
-    os.chmod(key_path, 0o600)
+def _install_cron(entries: List[Tuple[str, str]], i18n) -> None:
+    """Replace any existing lines for these commands and install them in one write."""
+
+    try:
+        # exits non-zero when the user has no crontab yet; that is an empty one
+        current = subprocess.run(["crontab", "-l"], capture_output=True, text=True, check=False).stdout or ""
+        commands = [cmd for _, cmd in entries]
+        lines = [line for line in current.splitlines() if not any(cmd in line for cmd in commands)]
+        lines.extend(f"{schedule} {cmd}" for schedule, cmd in entries)
+        subprocess.run(["crontab", "-"], input="\n".join(lines) + "\n", text=True, capture_output=True, check=True)
+    except subprocess.CalledProcessError as exc:
+        output = (exc.stdout or "") + (exc.stderr or "")
+        raise CertError(i18n.t("certs.le_cmd_fail", command="crontab -", code=exc.returncode, output=output))
+    except FileNotFoundError as exc:
+        raise CertError(i18n.t("certs.le_cmd_fail", command="crontab", code=127, output=str(exc)))
 
 
-def _prompt_continue(i18n) -> bool:
-    answer = input(i18n.t("certs.prompt_fallback") + " ").strip().lower()
-    return answer in {"y", "yes", "д", "да"}
+def _download_acme(acme_path: Path, i18n) -> None:
+    # download next to the target and rename, so an interrupted
+    # transfer never leaves a truncated acme.sh behind
+    import http.client
+    import urllib.request  # pulls in http.client/ssl, only needed here
+
+    tmp_path = acme_path.with_name(acme_path.name + ".part")
+    try:
+        with urllib.request.urlopen(ACME_URL, timeout=30) as response, open(tmp_path, "wb") as fh:
+            shutil.copyfileobj(response, fh, 1 << 16)
+        os.chmod(tmp_path, 0o755)
+        os.replace(tmp_path, acme_path)
+    except (OSError, http.client.HTTPException) as exc:
+        # HTTPException covers a body cut short (IncompleteRead), which is
+        # not an OSError
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise CertError(i18n.t("certs.le_download_fail", error=str(exc)))
+
+
+def _write_file(path: Path, data: bytes, mode: int) -> None:
+    # the file gets its final mode before any data is written; fchmod
+    # covers files that already existed with looser permissions
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "wb") as fh:
+        os.fchmod(fd, mode)
+        fh.write(data)
 
 
 def _run_acme(cmd: List[str], i18n) -> None:
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 
 DEFAULT_DOCKER_ROOT = Path("/var/lib/docker")
+DAEMON_JSON = Path("/etc/docker/daemon.json")
+CACHE_FILE = Path("/var/lib/easy-install/docker_root.cache")
+CACHE_MAX_AGE = 24 * 60 * 60
 
 
 def ensure_docker_root(state, logger, i18n) -> Path:
@@ -22,16 +27,62 @@ def ensure_docker_root(state, logger, i18n) -> Path:
         return path
 
     logger.info(i18n.t("docker.root.start"))
-    path = (
-        _from_docker_info(logger, i18n)
-        or _from_daemon_json(logger, i18n)
-        or _default_root(logger, i18n)
-    )
+    # daemon.json is a plain file read; docker info (CLI + daemon RPC) is
+    # only needed when it does not set data-root, e.g. flags on dockerd
+    path = _from_daemon_json(logger, i18n) or _from_cache(logger, i18n)
+    if path is None:
+        path = _from_docker_info(logger, i18n)
+        if path is not None:
+            _write_cache(path)
+    path = path or _default_root(logger, i18n)
     state.docker_data_root = str(path)
     logger.info(i18n.t("docker.root.result", path=str(path)))
     return path
 
 
+def _from_cache(logger, i18n) -> Optional[Path]:
+    """Return the data-root saved by a previous run while it is still valid."""
+
+    try:
+        cache_mtime = os.stat(CACHE_FILE).st_mtime
+    except OSError:
+        return None
+
+    # dockerd flags and systemd drop-ins can also move data-root, so the
+    # cache ages out even while daemon.json stays untouched
+    if time.time() - cache_mtime >= CACHE_MAX_AGE:
+        return None
+    try:
+        if cache_mtime <= os.stat(DAEMON_JSON).st_mtime:
+            return None
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return None
+
+    try:
+        path_str = CACHE_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not path_str:
+        return None
+
+    path = Path(path_str)
+    logger.info(i18n.t("docker.root.cache_success", path=str(path), cache=str(CACHE_FILE)))
+    return path
+
+
+def _write_cache(path: Path) -> None:
+    # the cache is an optimisation only, failing to write it is not an error
+    tmp = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(f"{path}\n", encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+
+
 def _from_docker_info(logger, i18n) -> Optional[Path]:
     try:
         result = subprocess.run(
@@ -62,8 +113,8 @@ def _from_docker_info(logger, i18n) -> Optional[Path]:
 
 
 def _from_daemon_json(logger, i18n) -> Optional[Path]:
-    daemon_path = Path("/etc/docker/daemon.json")
-    if not daemon_path.exists():
+    daemon_path = DAEMON_JSON
+    if not os.path.exists(daemon_path):
         logger.debug(i18n.t("docker.root.daemon_missing_file", path=str(daemon_path)))
         return None
 
@@ -79,7 +130,8 @@ def _from_daemon_json(logger, i18n) -> Optional[Path]:
 
     root = data.get("data-root")
     if not root:
-        logger.warn(i18n.t("docker.root.daemon_no_key"))
+        # common for daemon.json files that only tune logging etc.
+        logger.debug(i18n.t("docker.root.daemon_no_key"))
         return None
 
     path = Path(root)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import shutil
 import subprocess
 import sys
-from typing import Optional
+from typing import Optional, Tuple
+
+from .which import which
 
 
 def ensure_docker_service(state, logger, i18n) -> str:
@@ -15,7 +16,7 @@ def ensure_docker_service(state, logger, i18n) -> str:
         logger.info(i18n.t("docker.service.dry_run"))
         return "SKIP"
 
-    docker_path = shutil.which("docker")
+    docker_path = which("docker")
     if not docker_path:
         logger.error(i18n.t("docker.service.missing_binary"))
         logger.info(i18n.t("docker.service.hint"))
@@ -33,11 +34,11 @@ def ensure_docker_service(state, logger, i18n) -> str:
     elif status == "FOUND":
         logger.info(i18n.t("docker.service.active"))
 
-    version_output = _docker_version(logger, i18n, docker_path)
+    version_output, swarm_state = _docker_info(logger, i18n, docker_path)
     if version_output:
         logger.info(i18n.t("docker.service.version", version=version_output))
 
-    swarm_status = _ensure_swarm(logger, i18n, docker_path)
+    swarm_status = _ensure_swarm(logger, i18n, docker_path, swarm_state)
     if swarm_status == "FAILED":
         logger.error(i18n.t("docker.swarm.fail"))
         sys.exit(2)
@@ -56,7 +57,7 @@ def _ensure_service(logger, i18n) -> str:
     """Try to ensure Docker daemon is running via systemctl/service."""
 
     # Attempt systemctl first
-    if shutil.which("systemctl"):
+    if which("systemctl"):
         if _systemctl_is_active(logger):
             return "FOUND"
         logger.info(i18n.t("docker.service.systemctl_start"))
@@ -67,7 +68,7 @@ def _ensure_service(logger, i18n) -> str:
         logger.warn(i18n.t("docker.service.systemctl_failed"))
 
     # Fallback to service command
-    if shutil.which("service"):
+    if which("service"):
         logger.info(i18n.t("docker.service.service_start"))
         if _run_cmd(["service", "docker", "start"], logger, i18n):
             return "STARTED"
@@ -100,21 +101,7 @@ def _run_cmd(cmd, logger, i18n) -> bool:
     return False
 
 
-def _docker_version(logger, i18n, docker_path: str) -> Optional[str]:
-    try:
-        result = subprocess.run(
-            [docker_path, "--version"], capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as exc:
-        logger.warn(i18n.t("docker.service.version_fail", code=exc.returncode))
-    except Exception as exc:  # pragma: no cover
-        logger.warn(i18n.t("docker.service.version_error", error=str(exc)))
-    return None
-
-
-def _ensure_swarm(logger, i18n, docker_path: str) -> str:
-    state = _swarm_state(logger, i18n, docker_path)
+def _ensure_swarm(logger, i18n, docker_path: str, state: str) -> str:
     if state in {"active", "locked"}:
         return "FOUND"
     if state == "error":
@@ -128,18 +115,22 @@ def _ensure_swarm(logger, i18n, docker_path: str) -> str:
     return "FAILED"
 
 
-def _swarm_state(logger, i18n, docker_path: str) -> str:
+def _docker_info(logger, i18n, docker_path: str) -> Tuple[Optional[str], str]:
+    """Return (server version, swarm state) from a single docker info call."""
+
     try:
         result = subprocess.run(
-            [docker_path, "info", "--format", "{{.Swarm.LocalNodeState}}"],
+            [docker_path, "info", "--format", "{{.ServerVersion}}|{{.Swarm.LocalNodeState}}"],
             capture_output=True,
             text=True,
             check=True,
         )
-        return result.stdout.strip().lower()
     except subprocess.CalledProcessError as exc:
         logger.warn(i18n.t("docker.swarm.state_fail", code=exc.returncode))
+        return None, "error"
     except Exception as exc:  # pragma: no cover
         logger.warn(i18n.t("docker.swarm.state_error", error=str(exc)))
-    return "error"
+        return None, "error"
 
+    version, _, state = result.stdout.strip().partition("|")
+    return version or None, state.lower()
@@ -1,28 +1,52 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+try:  # optional, faster catalog parsing
+    import orjson as _json
+except ImportError:
+    import json as _json
+_loads = _json.loads
+
+@lru_cache(maxsize=8)
+def _load_catalog(path: str, mtime_ns: int) -> Tuple[Dict[str, str], FrozenSet[str]]:
+    # keyed by mtime so an edited catalog is re-read; callers must not mutate the dict
+    catalog = _loads(Path(path).read_bytes())
+    # only these entries have placeholders worth passing through format()
+    needs_format = frozenset(
+        k for k, v in catalog.items() if isinstance(v, str) and "{" in v
+    )
+    return catalog, needs_format
 
 class I18N:
     def __init__(self, locales_dir: Path, lang: str = "ru"):
         self.locales_dir = Path(locales_dir)
         self.lang = lang if lang in ("ru", "en") else "ru"
         self._cache: Dict[str, str] = {}
+        self._needs_format: FrozenSet[str] = frozenset()
         self.load()
 
     def load(self) -> None:
         file = self.locales_dir / f"{self.lang}.json"
-        if not file.exists():
+        try:
+            mtime_ns = file.stat().st_mtime_ns
+        except FileNotFoundError:
             # fallback to ru
             file = self.locales_dir / "ru.json"
             self.lang = "ru"
-        with file.open("r", encoding="utf-8") as f:
-            self._cache = json.load(f)
+            mtime_ns = file.stat().st_mtime_ns
+        self._cache, self._needs_format = _load_catalog(str(file), mtime_ns)
 
     def t(self, key: str, **kwargs) -> str:
         s = self._cache.get(key, key)
+        if not kwargs or key not in self._needs_format:
+            return s
         try:
             return s.format(**kwargs)
         except Exception:
             return s
+
+    def tmany(self, keys: Iterable[str], prefix: str = "") -> Dict[str, str]:
+        return {key: self._cache.get(prefix + key, prefix + key) for key in keys}
@@ -7,6 +7,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from .prompt import ask_yes
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
@@ -18,16 +20,16 @@ def run_install(state, logger, i18n) -> str:
 
     if not state.yes:
         try:
-            answer = input(i18n.t("install.prompt") + " ").strip().lower()
+            answer = ask_yes(i18n.t("install.prompt") + " ")
         except KeyboardInterrupt:
             logger.info(i18n.t("install.decline"))
             return "SKIP"
-        if answer not in {"y", "yes", "д", "да"}:
+        if not answer:
             logger.info(i18n.t("install.decline"))
             return "SKIP"
 
     install_script = REPO_ROOT / "script" / "install.py"
-    if not install_script.exists():
+    if not os.path.exists(install_script):
         logger.error(i18n.t("install.missing", path=str(install_script)))
         sys.exit(2)
 
@@ -43,6 +45,8 @@ def run_install(state, logger, i18n) -> str:
         extra_pp = state.venv_site_packages
         current_pp = env.get("PYTHONPATH", "")
         env["PYTHONPATH"] = f"{extra_pp}:{current_pp}" if current_pp else extra_pp
+    # install.py runs for a long time; get buffered log lines onto disk first
+    logger.flush()
     try:
         subprocess.run([python_exec, str(install_script), "--confirm-all"], check=True, env=env)
     except subprocess.CalledProcessError as exc:
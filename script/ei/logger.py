@@ -12,6 +12,48 @@ YELLOW = "\033[33m"
 RED = "\033[31m"
 CYAN = "\033[36m"
 
+_WARN_PREFIX = "⚠ "
+_ERROR_PREFIX = "✖ "
+_LEVEL_COLORS = {logging.WARNING: YELLOW, logging.ERROR: RED}
+
+class ColorFormatter(logging.Formatter):
+    """Console formatter: colours by ``extra={"color": ...}`` or by level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        color = getattr(record, "color", None) or _LEVEL_COLORS.get(record.levelno)
+        return color + text + RESET if color else text
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that flushes every ``capacity`` records and on warnings/errors."""
+
+    def __init__(self, filename: Path, capacity: int = 256, buffer_size: int = 1 << 16):
+        # set before super().__init__, which may open the stream
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding="utf-8")
+        self.capacity = capacity
+        self._pending = 0
+
+    def _open(self):
+        # the default 8 KiB buffer would split a batch into several writes
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.capacity or record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._pending = 0
+        super().flush()
+
+
 class Logger:
     def __init__(self, logfile: Path, verbose: bool = False):
         self.logfile = Path(logfile)
@@ -24,16 +66,19 @@ class Logger:
         self.logger.setLevel(logging.DEBUG)
 
         # file handler
-        fh = logging.FileHandler(self.logfile, encoding="utf-8")
+        # buffered; logging.shutdown() flushes whatever is left at exit
+        fh = BufferedFileHandler(self.logfile)
         fh.setLevel(logging.DEBUG)
         ffmt = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
         fh.setFormatter(ffmt)
         self.logger.addHandler(fh)
+        self._file_handler = fh
 
         # console handler
         ch = logging.StreamHandler(sys.stdout)
         ch.setLevel(logging.DEBUG if self.verbose else logging.INFO)
-        cfmt = logging.Formatter("%(message)s")
+        # colour is applied here only, the log file stays plain text
+        cfmt = ColorFormatter("%(message)s")
         ch.setFormatter(cfmt)
         self.logger.addHandler(ch)
 
@@ -44,13 +89,16 @@ class Logger:
         self.logger.debug(msg)
 
     def warn(self, msg: str):
-        self.logger.warning(f"{YELLOW}⚠ {msg}{RESET}")
+        self.logger.warning(_WARN_PREFIX + msg)
 
     def error(self, msg: str):
-        self.logger.error(f"{RED}✖ {msg}{RESET}")
+        self.logger.error(_ERROR_PREFIX + msg)
 
     def step(self, i: int, n: int, label: str):
-        self.info(f"{CYAN}⏳ [{i}/{n}] {label}{RESET}")
+        self.logger.info(f"⏳ [{i}/{n}] {label}", extra={"color": CYAN})
+
+    def flush(self):
+        self._file_handler.flush()
 
     def status(self, status: str):
         upper = status.upper()
@@ -60,4 +108,5 @@ class Logger:
             color = YELLOW
         else:
             color = RED
-        self.info(f"{color}✔ {status}{RESET}")
+        self.logger.info("✔ " + status, extra={"color": color})
+        self.flush()
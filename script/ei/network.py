@@ -3,36 +3,79 @@
 from __future__ import annotations
 
 import ipaddress
+import re
 import socket
+import string
+import struct
+from functools import lru_cache
 from typing import Optional
 
+SIOCGIFADDR = 0x8915
+RTF_UP = 0x0001
 
+# 2+ LDH labels of 1-63 chars, no leading/trailing hyphen, 253 chars max;
+# quantifiers are bounded and anchored so matching stays linear
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_DOMAIN_RE = re.compile(
+    r"(?=.{1,253}\Z)"
+    r"(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+"
+    r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\Z"
+)
+
+
+@lru_cache(maxsize=1)
 def get_primary_ip() -> Optional[str]:
-    """Detect primary non-loopback IPv4 address."""
+    """Detect primary non-loopback IPv4 address.
+
+    Uses the interface of the default route, so no packet or route lookup
+    towards the outside is needed; the UDP socket trick is the fallback.
+    """
+
+    addr = _default_route_ip() or _udp_probe_ip()
+    if addr is None or addr.startswith("127."):
+        return None
+    return addr
+
 
+def _default_route_ip() -> Optional[str]:
+    try:
+        import fcntl
+
+        with open("/proc/net/route", "r", encoding="ascii") as fh:
+            next(fh, None)  # header
+            routes = [line.split() for line in fh]
+        defaults = [
+            r for r in routes
+            if len(r) >= 7 and r[1] == "00000000" and int(r[3], 16) & RTF_UP
+        ]
+        if not defaults:
+            return None
+        iface = min(defaults, key=lambda r: int(r[6]))[0]
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            packed = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, struct.pack("256s", iface[:15].encode()))
+        addr = socket.inet_ntoa(packed[20:24])
+        ipaddress.IPv4Address(addr)
+        return addr
+    except Exception:
+        return None
+
+
+def _udp_probe_ip() -> Optional[str]:
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
             sock.connect(("8.8.8.8", 80))
             addr = sock.getsockname()[0]
             ipaddress.IPv4Address(addr)
-            if addr.startswith("127."):
-                return None
             return addr
     except Exception:
         return None
 
 
 def is_valid_domain(domain: str) -> bool:
-    if not domain:
-        return False
-    if len(domain) > 253:
+    if not domain or len(domain) > 253:
         return False
-    labels = domain.split(".")
-    if len(labels) < 2:
+    # cheap C-level reject of foreign characters before the regex runs
+    if not _DOMAIN_CHARS.issuperset(domain):
         return False
-    for label in labels:
-        if not label or len(label) > 63:
-            return False
-        if label.startswith("-") or label.endswith("-"):
-            return False
-    return True
+    return _DOMAIN_RE.match(domain) is not None
@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import re
 import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+# /usr/lib/os-release is the vendor copy, used when /etc has none
+OS_RELEASE_PATHS = (Path("/etc/os-release"), Path("/usr/lib/os-release"))
+
+# KEY=value, KEY="value" or KEY='value' per line; blanks and comments never match
+_OS_RELEASE_LINE = re.compile(
+    rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    rb"(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+_DEB_IDS = frozenset(("debian", "ubuntu"))
+_RPM_IDS = frozenset(("rhel", "centos", "rocky", "almalinux", "fedora", "amzn", "ol"))
 
 
 class OSType(Enum):
@@ -56,36 +71,37 @@ def detect_os(logger, i18n) -> OsInfo:
 
 
 def _read_os_release() -> Dict[str, str]:
-    path = Path("/etc/os-release")
-    data: Dict[str, str] = {}
-    if not path.exists():
-        return data
-
-    with path.open("r", encoding="utf-8", errors="ignore") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            value = value.strip().strip('"').strip("'")
-            data[key.strip()] = value
-    return data
+    return dict(_os_release_items())
 
 
-def _classify(os_id: str, id_like: List[str]) -> OSType:
-    deb_ids = {"debian", "ubuntu"}
-    rpm_ids = {"rhel", "centos", "rocky", "almalinux", "fedora", "amzn", "ol"}
+@lru_cache(maxsize=1)
+def _os_release_items() -> Tuple[Tuple[str, str], ...]:
+    # the file does not change during a run; parsed once, returned immutable
+    for path in OS_RELEASE_PATHS:
+        if path.exists():
+            break
+    else:
+        return ()
 
-    if os_id in deb_ids:
+    # the file is tiny: one read, one regex pass over all of it
+    return tuple(
+        (
+            match.group(1).decode("ascii"),
+            (match.group(2) or match.group(3) or match.group(4) or b"").decode("utf-8", errors="ignore"),
+        )
+        for match in _OS_RELEASE_LINE.finditer(path.read_bytes())
+    )
+
+
+def _classify(os_id: str, id_like: List[str]) -> OSType:
+    if os_id in _DEB_IDS:
         return OSType.DEB
-    if os_id in rpm_ids:
+    if os_id in _RPM_IDS:
         return OSType.RPM
 
-    if any(x in deb_ids for x in id_like):
+    if not _DEB_IDS.isdisjoint(id_like):
         return OSType.DEB
-    if any(x in rpm_ids for x in id_like):
+    if not _RPM_IDS.isdisjoint(id_like):
         return OSType.RPM
 
     return OSType.UNKNOWN
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from functools import lru_cache
+from typing import List, Optional, Sequence, Set, Tuple
 
 from .os_detect import OSType, OsInfo
+from .prompt import ask_yes
+from .which import which
 
 
-@dataclass
+@dataclass(frozen=True)
 class PackageRequest:
-    names: Sequence[str]
+    names: Tuple[str, ...]
     optional: bool = False
 
     @property
@@ -31,14 +33,37 @@ class PackageResult:
         return self.installed_name is not None
 
 
+# requests are immutable, so the per-OS lists are built once
+_DEB_BASE = (
+    PackageRequest(("nginx",)),
+    PackageRequest(("docker.io", "docker-ce")),
+    PackageRequest(("python3",)),
+    PackageRequest(("python3-venv",)),
+    PackageRequest(("python3-pip",)),
+    PackageRequest(("openssl",)),
+)
+_RPM_BASE = (
+    PackageRequest(("nginx",)),
+    PackageRequest(("docker", "moby-engine")),
+    PackageRequest(("python3",)),
+    PackageRequest(("python3-pip",)),
+    PackageRequest(("python3-virtualenv", "python3-venv")),
+    PackageRequest(("openssl",)),
+)
+_FIO_REQUIRED = PackageRequest(("fio",))
+_FIO_OPTIONAL = PackageRequest(("fio",), optional=True)
+
+
 def ensure_packages(state, logger, i18n, os_info: OsInfo) -> str:
     logger.info(i18n.t("pkg.start", os_type=i18n.t(os_info.type_label)))
 
     requests = _build_requests(state, os_info)
+    names = [name for request in requests for name in request.names]
+    installed_names = _query_installed(os_info, names)
     results: List[PackageResult] = []
 
     for request in requests:
-        installed = _check_request(request, os_info)
+        installed = _check_request(request, installed_names)
         results.append(installed)
         if installed.is_installed:
             logger.info(i18n.t("pkg.found", name=installed.installed_name))
@@ -59,14 +84,15 @@ def ensure_packages(state, logger, i18n, os_info: OsInfo) -> str:
 
     if not state.yes:
         logger.info(i18n.t("pkg.install.prompt", packages=", ".join(missing_required)))
-        if not _prompt(i18n):
+        if not ask_yes(i18n.t("pkg.install.ask") + " "):
             logger.info(i18n.t("pkg.commands", command=_install_command_preview(os_info, missing_required)))
             logger.info(i18n.t("pkg.exit"))
             sys.exit(2)
 
     _install_packages(logger, i18n, os_info, missing_required)
 
-    post_results = [_check_request(r.request, os_info) for r in results]
+    installed_names = _query_installed(os_info, names)
+    post_results = [_check_request(r.request, installed_names) for r in results]
     if all(r.is_installed or r.request.optional for r in post_results):
         logger.info(i18n.t("pkg.ok"))
         optional_missing = [r for r in post_results if not r.is_installed and r.request.optional]
@@ -81,62 +107,58 @@ def ensure_packages(state, logger, i18n, os_info: OsInfo) -> str:
 
 
 def _build_requests(state, os_info: OsInfo) -> List[PackageRequest]:
-    base = []
     if os_info.os_type == OSType.DEB:
-        base = [
-            PackageRequest(["nginx"]),
-            PackageRequest(["docker.io", "docker-ce"]),
-            PackageRequest(["python3"]),
-            PackageRequest(["python3-venv"]),
-            PackageRequest(["python3-pip"]),
-            PackageRequest(["openssl"]),
-        ]
-        need_fio = not state.skip_checks and not state.skip_bench
-        base.append(PackageRequest(["fio"], optional=not need_fio))
+        base = _DEB_BASE
     elif os_info.os_type == OSType.RPM:
-        base = [
-            PackageRequest(["nginx"]),
-            PackageRequest(["docker", "moby-engine"]),
-            PackageRequest(["python3"]),
-            PackageRequest(["python3-pip"]),
-            PackageRequest(["python3-virtualenv", "python3-venv"]),
-            PackageRequest(["openssl"]),
-        ]
-        need_fio = not state.skip_checks and not state.skip_bench
-        base.append(PackageRequest(["fio"], optional=not need_fio))
+        base = _RPM_BASE
     else:
-        base = []
-    return base
+        return []
+    need_fio = not state.skip_checks and not state.skip_bench
+    return [*base, _FIO_REQUIRED if need_fio else _FIO_OPTIONAL]
 
 
-def _check_request(request: PackageRequest, os_info: OsInfo) -> PackageResult:
+def _check_request(request: PackageRequest, installed_names: Set[str]) -> PackageResult:
     for name in request.names:
-        if _is_installed(name, os_info):
+        if name in installed_names:
             return PackageResult(request=request, installed_name=name)
     return PackageResult(request=request, installed_name=None)
 
 
-def _is_installed(name: str, os_info: OsInfo) -> bool:
+def _query_installed(os_info: OsInfo, names: Sequence[str]) -> Set[str]:
+    """Return the subset of ``names`` that is installed, using one package-manager call."""
+
+    if not names:
+        return set()
+    wanted = set(names)
     try:
         if os_info.os_type == OSType.DEB:
+            # non-zero exit when some names are unknown; the known ones are still printed
             result = subprocess.run(
-                ["dpkg-query", "-W", "-f=${Status}", name],
+                ["dpkg-query", "-W", "-f=${Package} ${Status}\n", *names],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 check=False,
             )
-            return result.returncode == 0 and "install ok installed" in result.stdout
+            installed = set()
+            for line in result.stdout.splitlines():
+                name, _, status = line.partition(" ")
+                if name in wanted and "install ok installed" in status:
+                    installed.add(name)
+            return installed
         if os_info.os_type == OSType.RPM:
-            result = subprocess.run(["rpm", "-q", name], capture_output=True, text=True, check=False)
-            return result.returncode == 0
+            # missing packages are reported as "package X is not installed" lines
+            result = subprocess.run(
+                ["rpm", "-q", "--queryformat", "%{NAME}\n", *names],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            return {line for line in result.stdout.splitlines() if line in wanted}
     except FileNotFoundError:
-        return False
-    return False
-
-
-def _prompt(i18n) -> bool:
-    answer = input(i18n.t("pkg.install.ask") + " ").strip().lower()
-    return answer in {"y", "yes", "д", "да"}
+        return set()
+    return set()
 
 
 def _install_command_preview(os_info: OsInfo, packages: Sequence[str]) -> str:
@@ -170,8 +192,9 @@ def _install_packages(logger, i18n, os_info: OsInfo, packages: Sequence[str]) ->
         sys.exit(exc.returncode or 2)
 
 
+@lru_cache(maxsize=1)
 def _find_rpm_installer() -> str:
     for candidate in ("dnf", "yum"):
-        if shutil.which(candidate):
+        if which(candidate):
             return candidate
     return "dnf"
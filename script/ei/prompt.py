@@ -0,0 +1,15 @@
+"""Interactive yes/no prompt shared by easy-install steps."""
+
+from __future__ import annotations
+
+
+YES_WORDS = frozenset(("y", "yes", "д", "да"))
+
+
+def ask_yes(prompt: str) -> bool:
+    """Ask a yes/no question; anything but a yes word (or closed stdin) means no."""
+
+    try:
+        return input(prompt).strip().lower() in YES_WORDS
+    except EOFError:
+        return False
@@ -2,31 +2,26 @@
 
 from __future__ import annotations
 
+import glob
 import os
-import shutil
+import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
-
-MIN_VERSION: Tuple[int, int, int] = (3, 8, 0)
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
+from .which import which
 
-class PythonRuntimeStatus(Tuple[str, str]):
-    """Tuple-like container describing current and required versions."""
+MIN_VERSION: Tuple[int, int, int] = (3, 8, 0)
 
-    __slots__ = ()
+_VERSIONED_NAME = re.compile(r"python(\d+)\.(\d+)$")
 
-    def __new__(cls, current: str, required: str) -> "PythonRuntimeStatus":
-        return tuple.__new__(cls, (current, required))
 
-    @property
-    def current(self) -> str:
-        return self[0]
+class PythonRuntimeStatus(NamedTuple):
+    """Current and required interpreter versions."""
 
-    @property
-    def required(self) -> str:
-        return self[1]
+    current: str
+    required: str
 
 
 def ensure_python(i18n, script_path: Path) -> PythonRuntimeStatus:
@@ -42,7 +37,12 @@ def ensure_python(i18n, script_path: Path) -> PythonRuntimeStatus:
     _emit(i18n.t("python.version.too_old", current=current_str, required=required_str))
     _emit(i18n.t("python.search.start", required=required_str))
 
-    for candidate in _candidate_interpreters():
+    for candidate, name_version in _candidate_interpreters():
+        if name_version is not None and name_version < MIN_VERSION[:2]:
+            # too old by its name alone, no need to run it
+            _emit(i18n.t("python.search.candidate", candidate=candidate, version=_format_version(name_version)))
+            continue
+
         version = _detect_version(candidate, i18n)
         if version is None:
             continue
@@ -60,25 +60,48 @@ def ensure_python(i18n, script_path: Path) -> PythonRuntimeStatus:
     sys.exit(10)
 
 
-def _candidate_interpreters() -> Iterable[str]:
-    names: List[str] = []
-    for minor in range(13, 7, -1):
-        names.append(f"python3.{minor}")
-    names.extend(["python3", "python"])
+def _candidate_interpreters() -> Iterable[Tuple[str, Optional[Tuple[int, int]]]]:
+    """Yield (path, (major, minor) from the file name), newest first.
+
+    ``python3.X`` binaries are found with one glob per PATH entry, so
+    names that cannot exist are never looked up. The name version only
+    orders and pre-filters candidates: a match is still run once to
+    confirm it, since e.g. pyenv shims exist for versions not installed.
+    Unversioned ``python3``/``python`` come last with version None.
+    """
+
+    versioned: List[Tuple[Tuple[int, int], str]] = []
+    for directory in os.get_exec_path():
+        for path in glob.glob(os.path.join(glob.escape(directory), "python3.*")):
+            match = _VERSIONED_NAME.search(os.path.basename(path))
+            if match and os.access(path, os.X_OK):
+                versioned.append(((int(match.group(1)), int(match.group(2))), path))
+    versioned.sort(key=lambda item: item[0], reverse=True)
 
     seen: set[str] = set()
-    for name in names:
-        path = shutil.which(name)
-        if not path or path in seen:
+    for version, path in versioned:
+        real = os.path.realpath(path)
+        if real in seen:
+            continue
+        seen.add(real)
+        yield path, version
+
+    for name in ("python3", "python"):
+        path = which(name)
+        if not path:
+            continue
+        real = os.path.realpath(path)
+        if real in seen:
             continue
-        seen.add(path)
-        yield path
+        seen.add(real)
+        yield path, None
 
 
 def _detect_version(executable: str, i18n) -> Optional[Tuple[int, int, int]]:
     try:
         result = subprocess.run(
             [executable, "-c", "import sys; print('.'.join(map(str, sys.version_info[:3])))"],
+            stdin=subprocess.DEVNULL,
             check=True,
             capture_output=True,
             text=True,
@@ -108,7 +131,9 @@ def _detect_version(executable: str, i18n) -> Optional[Tuple[int, int, int]]:
 
 
 def _reexec(executable: str, script_path: Path) -> None:
-    argv: List[str] = [executable, str(script_path), *sys.argv[1:]]
+    # runs before the logger opens its file; descriptors Python opens are
+    # non-inheritable by default, so nothing leaks into the new image
+    argv: List[str] = [executable, os.fspath(script_path), *sys.argv[1:]]
     os.execv(executable, argv)
 
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
 CONFIGS_DIR = SCRIPT_DIR.parent / "configs"
+CREATE_CONFIGS_SCRIPT = SCRIPT_DIR / "create_configs.py"
 
 
 def run_create_configs(state, logger, i18n) -> str:
@@ -15,7 +17,7 @@ def run_create_configs(state, logger, i18n) -> str:
         logger.info(i18n.t("configs.dry_run", path=str(CONFIGS_DIR)))
         return "SKIP"
 
-    script_path = SCRIPT_DIR / "create_configs.py"
+    script_path = CREATE_CONFIGS_SCRIPT
     if not script_path.exists():
         logger.error(i18n.t("configs.missing_script", path=str(script_path)))
         sys.exit(2)
@@ -23,7 +25,7 @@ def run_create_configs(state, logger, i18n) -> str:
     logger.info(i18n.t("configs.run", path=str(script_path)))
     python_exec = state.venv_python or sys.executable
     try:
-        subprocess.run([python_exec, str(script_path)], check=True)
+        subprocess.run([python_exec, str(script_path)], stdin=subprocess.DEVNULL, check=True)
     except subprocess.CalledProcessError as exc:
         logger.error(i18n.t("configs.run_fail", code=exc.returncode))
         sys.exit(exc.returncode or 2)
@@ -31,9 +33,18 @@ def run_create_configs(state, logger, i18n) -> str:
         logger.error(i18n.t("configs.python_missing"))
         sys.exit(2)
 
-    if not CONFIGS_DIR.exists() or not any(CONFIGS_DIR.iterdir()):
+    if not _has_entries(CONFIGS_DIR):
         logger.error(i18n.t("configs.no_output", path=str(CONFIGS_DIR)))
         sys.exit(2)
 
     logger.info(i18n.t("configs.success", path=str(CONFIGS_DIR)))
     return "DONE"
+
+
+def _has_entries(path: Path) -> bool:
+    # stops at the first entry instead of listing the directory
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
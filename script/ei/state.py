@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 
+# slots drop the per-instance __dict__; dataclass supports them from 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class State:
     yes: bool
     lang: str
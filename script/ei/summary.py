@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+CONFIGS_PATH = (Path(__file__).resolve().parent.parent.parent / "configs").resolve()
+TEAM_PATH = CONFIGS_PATH / "team.yaml"
+
 
 def print_summary(state, logger, i18n) -> str:
     if state.dry_run:
@@ -15,8 +18,7 @@ def print_summary(state, logger, i18n) -> str:
     logger.info(i18n.t("summary.domain", domain=state.domain or i18n.t("summary.none")))
     logger.info(i18n.t("summary.host_ip", host_ip=state.host_ip or i18n.t("summary.unknown")))
     logger.info(i18n.t("summary.root_mount", path=state.root_mount))
-    configs_path = (Path(__file__).resolve().parent.parent.parent / "configs").resolve()
-    logger.info(i18n.t("summary.configs", path=str(configs_path)))
+    logger.info(i18n.t("summary.configs", path=str(CONFIGS_PATH)))
     logger.info(i18n.t("summary.certs", bundle="/etc/nginx/ssl/compass.bundle.crt", cert_key="/etc/nginx/ssl/compass.key"))
 
     if state.admin_email:
@@ -28,8 +30,7 @@ def print_summary(state, logger, i18n) -> str:
         logger.info(i18n.t("summary.admin_password_cli"))
     else:
         logger.info(i18n.t("summary.admin_password_generated"))
-    team_path = (configs_path / "team.yaml").resolve()
-    logger.info(i18n.t("summary.admin_password_location", path=str(team_path)))
+    logger.info(i18n.t("summary.admin_password_location", path=str(TEAM_PATH)))
 
     logger.info(i18n.t("summary.log_file", path=state.log_file))
     if state.install_executed:
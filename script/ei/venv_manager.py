@@ -7,7 +7,7 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
@@ -50,20 +50,31 @@ def ensure_virtualenv(state, logger, i18n) -> str:
             sys.path.insert(0, str(site_packages))
     issues = False
 
+    names = [dep.pip_name for dep in DEPENDENCIES]
+    versions = _get_installed_versions(venv_python, names)
+    to_install: List[Dependency] = []
     for dep in DEPENDENCIES:
-        installed = _get_installed_version(venv_python, dep.pip_name)
+        installed = versions.get(dep.pip_name)
         if installed and installed in dep.accepted:
             logger.info(i18n.t("venv.pkg.present", name=dep.pip_name, version=installed))
             continue
 
-        target_version = dep.preferred
-        logger.info(i18n.t("venv.pkg.install", name=dep.pip_name, version=target_version))
-        if not _pip_install(venv_python, dep.pip_name, target_version, logger, i18n):
-            issues = True
-            continue
-
-        post_version = _get_installed_version(venv_python, dep.pip_name)
-        if post_version == target_version:
+        logger.info(i18n.t("venv.pkg.install", name=dep.pip_name, version=dep.preferred))
+        to_install.append(dep)
+
+    if to_install:
+        # one pip run resolves everything together and pays pip's startup once
+        specs = [f"{dep.pip_name}=={dep.preferred}" for dep in to_install]
+        if not _pip_install(venv_python, specs, logger, i18n):
+            # the resolver fails the whole batch for one bad spec; retry
+            # each on its own so the rest still gets installed
+            for spec in specs:
+                if not _pip_install(venv_python, [spec], logger, i18n):
+                    issues = True
+        versions = _get_installed_versions(venv_python, [dep.pip_name for dep in to_install])
+    for dep in to_install:
+        post_version = versions.get(dep.pip_name)
+        if post_version == dep.preferred:
             logger.info(i18n.t("venv.pkg.installed", name=dep.pip_name, version=post_version))
         elif post_version in dep.accepted:
             logger.warn(i18n.t("venv.pkg.accepted", name=dep.pip_name, version=post_version))
@@ -82,15 +93,21 @@ def _ensure_venv_created(logger, i18n) -> Path:
 
     logger.info(i18n.t("venv.create", path=str(VENV_DIR)))
     try:
-        subprocess.run(
-            [sys.executable, "-m", "venv", "--system-site-packages", str(VENV_DIR)],
-            check=True,
-        )
+        import venv
+    except ImportError:
+        logger.error(i18n.t("venv.create_missing"))
+        sys.exit(2)
+
+    # built in-process, same as "python -m venv --system-site-packages";
+    # only ensurepip still runs as a child of the new interpreter
+    builder = venv.EnvBuilder(system_site_packages=True, with_pip=True, symlinks=os.name != "nt")
+    try:
+        builder.create(str(VENV_DIR))
     except subprocess.CalledProcessError as exc:
         logger.error(i18n.t("venv.create_fail", code=exc.returncode))
         sys.exit(exc.returncode or 2)
-    except FileNotFoundError:
-        logger.error(i18n.t("venv.create_missing"))
+    except OSError as exc:
+        logger.error(i18n.t("venv.create_fail", code=str(exc)))
         sys.exit(2)
 
     if not python_path.exists():
@@ -101,28 +118,39 @@ def _ensure_venv_created(logger, i18n) -> Path:
     return python_path
 
 
-def _get_installed_version(venv_python: Path, package: str) -> str | None:
+def _get_installed_versions(venv_python: Path, packages: List[str]) -> Dict[str, Optional[str]]:
+    """Versions of ``packages`` inside the venv (None if absent), from one interpreter run."""
+
+    versions: Dict[str, Optional[str]] = dict.fromkeys(packages)
     try:
         result = subprocess.run(
-            [str(venv_python), "-c", _VERSION_SNIPPET, package],
+            [str(venv_python), "-c", _VERSION_SNIPPET, *packages],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             check=True,
         )
-        value = result.stdout.strip()
-        return value if value else None
     except subprocess.CalledProcessError:
-        return None
+        return versions
+
+    for line in result.stdout.splitlines():
+        name, _, version = line.partition("\t")
+        if name in versions:
+            versions[name] = version or None
+    return versions
 
 
 _VERSION_SNIPPET = (
-    "import importlib.metadata, sys;"
-    "pkg=sys.argv[1];"
-    "print(importlib.metadata.version(pkg))"
+    "import importlib.metadata as m, sys\n"
+    "for p in sys.argv[1:]:\n"
+    "    try:\n"
+    "        print(p + '\\t' + m.version(p))\n"
+    "    except m.PackageNotFoundError:\n"
+    "        print(p + '\\t')\n"
 )
 
 
-def _pip_install(venv_python: Path, package: str, version: str, logger, i18n) -> bool:
+def _pip_install(venv_python: Path, specs: List[str], logger, i18n) -> bool:
     try:
         subprocess.run(
             [
@@ -131,13 +159,15 @@ def _pip_install(venv_python: Path, package: str, version: str, logger, i18n) ->
                 "pip",
                 "install",
                 "--no-input",
-                f"{package}=={version}",
+                "--disable-pip-version-check",
+                *specs,
             ],
+            stdin=subprocess.DEVNULL,
             check=True,
         )
         return True
     except subprocess.CalledProcessError as exc:
-        logger.error(i18n.t("venv.pip_fail", package=package, code=exc.returncode))
+        logger.error(i18n.t("venv.pip_fail", package=" ".join(specs), code=exc.returncode))
     except FileNotFoundError:
         logger.error(i18n.t("venv.pip_missing"))
     except Exception as exc:  # pragma: no cover
@@ -0,0 +1,23 @@
+"""Cached executable lookups for easy-install."""
+
+from __future__ import annotations
+
+import shutil
+from typing import Dict, Optional
+
+
+_FOUND: Dict[str, str] = {}
+
+
+def which(name: str) -> Optional[str]:
+    """shutil.which with the hits memoized for the rest of the run.
+
+    Misses are not cached: the package step may install the binary later.
+    """
+
+    path = _FOUND.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _FOUND[name] = path
+    return path
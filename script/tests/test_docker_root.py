@@ -0,0 +1,68 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ei import docker_root
+
+
+class _Logger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _I18n:
+    def t(self, key, **kwargs):
+        return key
+
+
+class FromCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.daemon_json = Path(tmp.name) / "daemon.json"
+        self.cache_file = Path(tmp.name) / "docker_root.cache"
+        for name, value in (("DAEMON_JSON", self.daemon_json), ("CACHE_FILE", self.cache_file)):
+            patcher = mock.patch.object(docker_root, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # daemon.json that only tunes logging, older than the cache
+        self.daemon_json.write_text('{"log-driver": "json-file"}', encoding="utf-8")
+        self.cache_file.write_text("/srv/docker\n", encoding="utf-8")
+
+    def _age(self, path, seconds):
+        stamp = time.time() - seconds
+        os.utime(path, (stamp, stamp))
+
+    def test_fresh_cache_is_used(self):
+        self._age(self.daemon_json, 120)
+        self._age(self.cache_file, 60)
+
+        self.assertIsNone(docker_root._from_daemon_json(_Logger(), _I18n()))
+        self.assertEqual(docker_root._from_cache(_Logger(), _I18n()), Path("/srv/docker"))
+
+    def test_old_cache_is_stale_without_data_root(self):
+        self._age(self.daemon_json, 3 * docker_root.CACHE_MAX_AGE)
+        self._age(self.cache_file, 2 * docker_root.CACHE_MAX_AGE)
+
+        self.assertIsNone(docker_root._from_daemon_json(_Logger(), _I18n()))
+        self.assertIsNone(docker_root._from_cache(_Logger(), _I18n()))
+
+    def test_cache_older_than_daemon_json_is_stale(self):
+        self._age(self.cache_file, 120)
+        self._age(self.daemon_json, 60)
+
+        self.assertIsNone(docker_root._from_cache(_Logger(), _I18n()))
+
+    def test_old_cache_is_stale_without_daemon_json(self):
+        self.daemon_json.unlink()
+        self._age(self.cache_file, 2 * docker_root.CACHE_MAX_AGE)
+
+        self.assertIsNone(docker_root._from_cache(_Logger(), _I18n()))
+
+
+if __name__ == "__main__":
+    unittest.main()